@@ -21,6 +21,7 @@ Note: Automatically uses PlatformIO's Python if pyserial is not available.
 import sys
 import os
 import time
+import functools
 import subprocess
 
 
@@ -90,25 +91,12 @@ class Colors:
             except Exception:
                 self.enabled = False
 
-    @property
-    def CYAN(self):
-        return "\033[0;36m" if self.enabled else ""
-
-    @property
-    def GREEN(self):
-        return "\033[0;32m" if self.enabled else ""
-
-    @property
-    def YELLOW(self):
-        return "\033[0;33m" if self.enabled else ""
-
-    @property
-    def RED(self):
-        return "\033[0;31m" if self.enabled else ""
-
-    @property
-    def NC(self):
-        return "\033[0m" if self.enabled else ""
+        # Resolved once; every log line reads these
+        self.CYAN = "\033[0;36m" if self.enabled else ""
+        self.GREEN = "\033[0;32m" if self.enabled else ""
+        self.YELLOW = "\033[0;33m" if self.enabled else ""
+        self.RED = "\033[0;31m" if self.enabled else ""
+        self.NC = "\033[0m" if self.enabled else ""
 
 
 C = Colors()
@@ -140,24 +128,28 @@ ENV_PENTA = "pentabuzzer_esp32s3"
 _port_envs = {}
 
 
+def classify_port(port):
+    """PlatformIO environment for a serial port, or None if not a glove"""
+    # Match by Adafruit VID and known PIDs (BlueBuzzah nRF52840)
+    if port.vid == ADAFRUIT_VID and port.pid in FEATHER_PIDS:
+        return ENV_NRF52
+    # Espressif USB-CDC (PentaBuzzer XIAO ESP32-S3)
+    if port.vid == ESPRESSIF_VID:
+        return ENV_PENTA
+    # Fallback: match by description
+    if port.description and "nRF52" in port.description:
+        return ENV_NRF52
+    return None
+
+
 def find_devices():
     """Find connected BlueBuzzah/PentaBuzzah devices (cross-platform)"""
-    devices = []
     _port_envs.clear()
     for port in serial.tools.list_ports.comports():
-        # Match by Adafruit VID and known PIDs (BlueBuzzah nRF52840)
-        if port.vid == ADAFRUIT_VID and port.pid in FEATHER_PIDS:
-            devices.append(port.device)
-            _port_envs[port.device] = ENV_NRF52
-        # Espressif USB-CDC (PentaBuzzer XIAO ESP32-S3)
-        elif port.vid == ESPRESSIF_VID:
-            devices.append(port.device)
-            _port_envs[port.device] = ENV_PENTA
-        # Fallback: match by description
-        elif port.description and "nRF52" in port.description:
-            devices.append(port.device)
-            _port_envs[port.device] = ENV_NRF52
-    return sorted(devices)
+        env_name = classify_port(port)
+        if env_name:
+            _port_envs[port.device] = env_name
+    return sorted(_port_envs)
 
 
 def env_for_port(port):
@@ -220,34 +212,32 @@ def configure_role(port, role, retries=5, avoid_port=None):
                 ser.write(command.encode())
                 ser.flush()  # Ensure command is sent
 
-                # Wait for device to process and respond
-                time.sleep(1.0)
-
-                # Read response, looking for confirmation
+                # Read response line by line as it arrives, looking for confirmation
                 # Device prints "[SETTINGS] Saved" before "[CONFIG] Role set to X - restarting..."
                 # We match on [SETTINGS] Saved because the [CONFIG] message may not transmit
                 # before the device reboots (USB CDC timing race)
                 expected_confirmation = "[SETTINGS] Saved"
                 response = ""
+                ser.timeout = 0.25  # Per-read wait; the deadline below bounds the total
                 start_time = time.time()
                 try:
-                    while (time.time() - start_time) < 3.0:  # 3 second timeout
-                        if ser.in_waiting:
-                            chunk = ser.read(ser.in_waiting).decode(errors='ignore')
-                            response += chunk
-                            # Check for confirmation with CORRECT role
-                            if expected_confirmation in response:
-                                print(f"  {C.GREEN}Role configured as {role}!{C.NC}")
-                                # Device will reboot - wait for it
-                                time.sleep(2)
-                                return True
-                            # Check if wrong role was set
-                            if "[CONFIG] Role set to" in response and expected_confirmation not in response:
-                                print(f"  {C.RED}ERROR: Device set wrong role!{C.NC}")
-                                print(f"  Expected: {role}")
-                                print(f"  Response: {response.strip()}")
-                                return False
-                        time.sleep(0.1)
+                    while (time.time() - start_time) < 4.0:  # 4 second timeout
+                        chunk = ser.read_until(b"\n", 256).decode(errors='ignore')
+                        if not chunk:
+                            continue
+                        response += chunk
+                        # Check for confirmation with CORRECT role
+                        if expected_confirmation in response:
+                            print(f"  {C.GREEN}Role configured as {role}!{C.NC}")
+                            # Device will reboot - wait for it
+                            time.sleep(2)
+                            return True
+                        # Check if wrong role was set
+                        if "[CONFIG] Role set to" in response and expected_confirmation not in response:
+                            print(f"  {C.RED}ERROR: Device set wrong role!{C.NC}")
+                            print(f"  Expected: {role}")
+                            print(f"  Response: {response.strip()}")
+                            return False
                 except OSError:
                     # Device disconnected - expected when it reboots after setting role
                     if expected_confirmation in response:
@@ -311,15 +301,17 @@ def verify_role(port, expected_role, retries=3):
                 ser.write(b"GET_ROLE\n")
                 ser.flush()
 
-                # Wait for response
-                time.sleep(0.5)
+                # Read lines until the full role reply arrives (or time runs out).
+                # read_until() returns partial data on timeout, so only stop once
+                # the line carrying "Current role:" has its line ending.
                 response = ""
+                ser.timeout = 0.25
                 start_time = time.time()
-                while (time.time() - start_time) < 2.0:
-                    if ser.in_waiting:
-                        chunk = ser.read(ser.in_waiting).decode(errors='ignore')
-                        response += chunk
-                    time.sleep(0.1)
+                while (time.time() - start_time) < 2.5:
+                    response += ser.read_until(b"\n", 256).decode(errors='ignore')
+                    marker = response.find("Current role:")
+                    if marker >= 0 and "\n" in response[marker:]:
+                        break
 
                 # Parse role from response
                 # Expected format: "[CONFIG] Current role: PRIMARY" or similar
@@ -359,13 +351,14 @@ def verify_role(port, expected_role, retries=3):
 # =============================================================================
 
 # Project directory - set when running as PlatformIO script
-_pio_project_dir = [None]
+_PIO_PROJECT_DIR = None
 
 
+@functools.lru_cache(maxsize=1)
 def get_project_dir():
     """Get the project directory (works both as PIO script and standalone)"""
-    if _pio_project_dir[0]:
-        return _pio_project_dir[0]
+    if _PIO_PROJECT_DIR:
+        return _PIO_PROJECT_DIR
     # Standalone mode - use script location
     return os.path.dirname(os.path.abspath(__file__))
 
@@ -386,6 +379,11 @@ def run_pio_command(args):
     return result.returncode == 0
 
 
+# Environments built by build_firmware() in this run; uploads for these skip
+# the rebuild pass
+_built_envs = set()
+
+
 def build_firmware():
     """Build firmware for every detected board type (defaults to nRF52)"""
     find_devices()
@@ -395,6 +393,7 @@ def build_firmware():
         if not run_pio_command(["run", "-e", env_name]):
             print(f"\n{C.RED}Build failed!{C.NC}")
             return False
+        _built_envs.add(env_name)
     print(f"\n{C.GREEN}Build complete!{C.NC}")
     return True
 
@@ -403,7 +402,8 @@ def upload_firmware(port):
     """Upload firmware to specified port using the board's environment"""
     env_name = env_for_port(port)
     print(f"\n{C.YELLOW}Uploading firmware to {port} ({env_name})...{C.NC}\n")
-    if run_pio_command(["run", "-e", env_name, "-t", "upload", "--upload-port", port]):
+    targets = ["-t", "nobuild", "-t", "upload"] if env_name in _built_envs else ["-t", "upload"]
+    if run_pio_command(["run", "-e", env_name] + targets + ["--upload-port", port]):
         print(f"\n{C.GREEN}Upload complete!{C.NC}")
         return True
     else:
@@ -567,39 +567,26 @@ def deploy_multiple_devices(devices):
 
     print(f"\n{C.CYAN}Assign device roles for deployment:{C.NC}\n")
 
-    # Get PRIMARY selection
-    print("Which device is PRIMARY? (enter number, or 'q' to quit): ", end="", flush=True)
-    primary_choice = input().strip()
-    if primary_choice.lower() == 'q':
-        print("Aborted.")
-        return False
-
-    # Get SECONDARY selection
-    print("Which device is SECONDARY? (enter number, or 'q' to quit): ", end="", flush=True)
-    secondary_choice = input().strip()
-    if secondary_choice.lower() == 'q':
-        print("Aborted.")
-        return False
-
-    # Validate selections
-    try:
-        primary_idx = int(primary_choice) - 1
-        secondary_idx = int(secondary_choice) - 1
-    except ValueError:
-        print(f"{C.RED}Invalid selection!{C.NC}")
-        return False
-
-    if primary_idx == secondary_idx:
-        print(f"{C.RED}Error: PRIMARY and SECONDARY must be different devices!{C.NC}")
-        return False
-
-    if not (0 <= primary_idx < len(devices)):
-        print(f"{C.RED}Invalid PRIMARY selection!{C.NC}")
-        return False
+    # Get PRIMARY and SECONDARY in one prompt; re-prompt until valid
+    while True:
+        print("Enter PRIMARY and SECONDARY device numbers (e.g. '1 2'), or 'q' to quit: ", end="", flush=True)
+        choice = input().strip()
+        if choice.lower() == 'q':
+            print("Aborted.")
+            return False
 
-    if not (0 <= secondary_idx < len(devices)):
-        print(f"{C.RED}Invalid SECONDARY selection!{C.NC}")
-        return False
+        try:
+            primary_idx, secondary_idx = (int(x) - 1 for x in choice.replace(",", " ").split())
+        except ValueError:
+            print(f"{C.RED}Invalid selection! Enter two device numbers.{C.NC}")
+            continue
+
+        if primary_idx == secondary_idx:
+            print(f"{C.RED}Error: PRIMARY and SECONDARY must be different devices!{C.NC}")
+        elif not (0 <= primary_idx < len(devices) and 0 <= secondary_idx < len(devices)):
+            print(f"{C.RED}Invalid selection! Choose numbers 1-{len(devices)}.{C.NC}")
+        else:
+            break
 
     primary_dev = devices[primary_idx]
     secondary_dev = devices[secondary_idx]
@@ -699,7 +686,8 @@ try:
     Import("env")
 
     # Set project directory from PlatformIO environment
-    _pio_project_dir[0] = env.subst("$PROJECT_DIR")
+    _PIO_PROJECT_DIR = env.subst("$PROJECT_DIR")
+    get_project_dir.cache_clear()
 
     def pio_deploy(source, target, env):
         print(f"\n{C.YELLOW}NOTE: Interactive deploy requires running directly:{C.NC}")
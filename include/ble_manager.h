@@ -459,6 +459,7 @@ private:
         uint8_t head;
         uint8_t tail;
         uint8_t count;
+        uint32_t dropped;  // Full-queue drops since the ring last drained empty (critical-section-guarded)
     };
 
     // Two priority lanes, routed by destination (see ringFor). The hi lane carries
@@ -496,6 +497,13 @@ private:
     bool enqueueStampedToRing(TxRing& ring, uint16_t connHandle, TxStampKind kind,
                               uint32_t seqId, uint64_t t2, uint64_t anchorUs);
 
+    /**
+     * @brief Log a full-queue drop, rate-limited to the 1st, 2nd, 4th, 8th...
+     * @param what Message kind for the log line
+     * @param dropped Drops in the current outage, including this one
+     */
+    static void logTxDrop(const char* what, uint32_t dropped);
+
     /**
      * @brief Process pending TX queue entries
      * Called from update() to drain the hi lane, then the normal lane, incrementally
@@ -277,6 +277,8 @@ private:
     /**
      * @brief Configure DRV2605 for LRA mode with RTP
      * @param drv Reference to DRV2605 driver
+     *
+     * Leaves the RTP value at 0 (motor off).
      */
     void configureDRV2605(Adafruit_DRV2605& drv);
 
@@ -369,8 +371,8 @@ private:
      * @brief LiPo discharge curve for accurate percentage calculation
      * Format: {voltage, percentage}
      */
-    static const float VOLTAGE_CURVE[][2];
-    static const uint8_t VOLTAGE_CURVE_SIZE;
+    static constexpr uint8_t VOLTAGE_CURVE_SIZE = 21;
+    static const float VOLTAGE_CURVE[VOLTAGE_CURVE_SIZE][2];
 
     /**
      * @brief Interpolate percentage from voltage curve
@@ -518,7 +518,7 @@ private:
 
     // Macrocycle tracking (v1 parity: 3 patterns per macrocycle)
     uint8_t _patternsInMacrocycle;      // Count of patterns executed in current macrocycle (0-2)
-    static const uint8_t PATTERNS_PER_MACROCYCLE = 3;  // v1: 3 patterns per macrocycle
+    static constexpr uint8_t PATTERNS_PER_MACROCYCLE = 3;  // v1: 3 patterns per macrocycle
 
     // Flow control state machine (used by MACROCYCLE mode)
     BuzzFlowState _buzzFlowState;       // NOTE: Used by MACROCYCLE, not just BUZZ (legacy name)
@@ -107,7 +107,7 @@ inline const char* therapyStateToString(TherapyState state) {
 /**
  * @brief Check if state represents an active therapy session
  */
-inline bool isActiveState(TherapyState state) {
+constexpr bool isActiveState(TherapyState state) {
     return state == TherapyState::RUNNING ||
            state == TherapyState::PAUSED ||
            state == TherapyState::LOW_BATTERY;
@@ -30,6 +30,7 @@ BLEManager::BLEManager() :
 {
     _txHi.head = _txHi.tail = _txHi.count = 0;
     _txNormal.head = _txNormal.tail = _txNormal.count = 0;
+    _txHi.dropped = _txNormal.dropped = 0;
 
     memset(_deviceName, 0, sizeof(_deviceName));
     memset(_targetName, 0, sizeof(_targetName));
@@ -94,7 +95,7 @@ bool BLEManager::begin(DeviceRole role, const char* deviceName) {
     // MACROCYCLE messages are ~160 bytes - MTU must exceed this to avoid fragmentation
     // EVENT_LEN and queue sizes must also be increased to prevent SoftDevice instability
     // See: https://github.com/adafruit/Adafruit_nRF52_Arduino/issues/721
-    const uint16_t BLE_MTU = 200;          // Fits MACROCYCLE (~160 bytes) with headroom
+    constexpr uint16_t BLE_MTU = 200;      // Fits MACROCYCLE (~160 bytes) with headroom
 
     // event_length is the radio time the SoftDevice RESERVES per connection
     // event, in 1.25ms units. It must fit inside the connection interval, and
@@ -526,8 +527,9 @@ bool BLEManager::enqueueToRing(TxRing& ring, uint16_t connHandle, const char* me
     PLATFORM_CRITICAL_ENTER();
 
     if (ring.count >= TX_QUEUE_SIZE) {
+        const uint32_t dropped = ++ring.dropped;
         PLATFORM_CRITICAL_EXIT();
-        Serial.println(F("[BLE] TX queue full, dropping message"));
+        logTxDrop("message", dropped);
         return false;
     }
 
@@ -671,6 +673,17 @@ void BLEManager::drainRing(TxRing& ring, uint8_t maxEntries) {
             break;
         }
     }
+
+    // The outage ends once the backlog has fully drained; a drop after that
+    // starts a new count and logs again. Freeing a single slot does not
+    // count, or a congested link would log every burst.
+    if (ring.dropped != 0) {
+        PLATFORM_CRITICAL_ENTER();
+        if (ring.count == 0) {
+            ring.dropped = 0;
+        }
+        PLATFORM_CRITICAL_EXIT();
+    }
 }
 
 size_t BLEManager::tryWriteImmediate(uint16_t connHandle, const uint8_t* data, size_t len) {
@@ -769,8 +782,9 @@ bool BLEManager::enqueueStampedToRing(TxRing& ring, uint16_t connHandle, TxStamp
     PLATFORM_CRITICAL_ENTER();
 
     if (ring.count >= TX_QUEUE_SIZE) {
+        const uint32_t dropped = ++ring.dropped;
         PLATFORM_CRITICAL_EXIT();
-        Serial.println(F("[BLE] TX queue full, dropping sync message"));
+        logTxDrop("sync message", dropped);
         return false;
     }
 
@@ -805,6 +819,36 @@ bool BLEManager::enqueueStampedToRing(TxRing& ring, uint16_t connHandle, TxStamp
 // INTERNAL HELPERS
 // =============================================================================
 
+void BLEManager::logTxDrop(const char* what, uint32_t dropped) {
+    // A stalled link fails every send; printing each drop from the BLE callback
+    // path would flood Serial, so log only at powers of two. drainRing() restarts
+    // the count once the ring empties, so every new outage logs its first drop.
+    if ((dropped & (dropped - 1)) == 0) {
+        Serial.printf("[BLE] TX queue full, dropping %s (%lu dropped)\n",
+                      what, (unsigned long)dropped);
+    }
+}
+
+/**
+ * @brief Append a run of received bytes to a connection's RX buffer
+ *
+ * Carriage returns are dropped. Copying stops once the buffer is full; the
+ * caller treats that as an overflow.
+ */
+static void appendRxBytes(BBConnection* conn, const uint8_t* src, size_t n) {
+    while (n > 0 && conn->rxIndex < RX_BUFFER_SIZE - 1) {
+        const uint8_t* cr = static_cast<const uint8_t*>(memchr(src, '\r', n));
+        size_t run = cr ? static_cast<size_t>(cr - src) : n;
+        size_t room = (RX_BUFFER_SIZE - 1) - conn->rxIndex;
+        size_t take = run < room ? run : room;
+        memcpy(&conn->rxBuffer[conn->rxIndex], src, take);
+        conn->rxIndex = static_cast<uint16_t>(conn->rxIndex + take);  // take <= free space
+        if (!cr) return;
+        src += run + 1;
+        n -= run + 1;
+    }
+}
+
 BBConnection* BLEManager::findConnection(uint16_t connHandleParam) {
     for (int i = 0; i < MAX_CONNECTIONS; i++) {
         if (_connections[i].connHandle == connHandleParam) {
@@ -917,30 +961,27 @@ void BLEManager::processIncomingData(uint16_t connHandleParam, const uint8_t* da
         conn->rxTimestamp = rxTimestamp;
     }
 
-    // Append data to buffer
-    for (uint16_t i = 0; i < len && conn->rxIndex < RX_BUFFER_SIZE - 1; i++) {
-        uint8_t c = data[i];
-
-        // Skip carriage return
-        if (c == '\r') {
-            continue;
+    // Append data to buffer. memchr() finds each terminator so the bytes
+    // between frames are copied in bulk instead of tested one at a time.
+    const uint8_t* p = data;
+    const uint8_t* const end = data + len;
+    while (p < end && conn->rxIndex < RX_BUFFER_SIZE - 1) {
+        // Message terminator is EOT only - phone apps must send EOT
+        const uint8_t* eot = static_cast<const uint8_t*>(memchr(p, EOT_CHAR, end - p));
+        appendRxBytes(conn, p, (eot ? eot : end) - p);
+        if (!eot || conn->rxIndex >= RX_BUFFER_SIZE - 1) {
+            break;
         }
 
-        // Check for message terminator (EOT only - phone apps must send EOT)
-        if (c == EOT_CHAR) {
-            // End of message - null terminate
-            conn->rxBuffer[conn->rxIndex] = '\0';
-
-            if (conn->rxIndex > 0) {
-                deliverMessage(conn, connHandleParam);
-            }
-
-            // Reset buffer for next message
-            conn->rxIndex = 0;
-        } else {
-            // Add to buffer
-            conn->rxBuffer[conn->rxIndex++] = c;
+        // End of message - null terminate and deliver
+        conn->rxBuffer[conn->rxIndex] = '\0';
+        if (conn->rxIndex > 0) {
+            deliverMessage(conn, connHandleParam);
         }
+
+        // Reset buffer for next message
+        conn->rxIndex = 0;
+        p = eot + 1;
     }
 
     // NOTE: Do NOT deliver partial messages here!
@@ -995,30 +1036,27 @@ void BLEManager::processClientIncomingData(const uint8_t* data, uint16_t len, ui
         conn->rxTimestamp = rxTimestamp;
     }
 
-    // Append data to buffer
-    for (uint16_t i = 0; i < len && conn->rxIndex < RX_BUFFER_SIZE - 1; i++) {
-        uint8_t c = data[i];
-
-        // Skip carriage return
-        if (c == '\r') {
-            continue;
+    // Append data to buffer. memchr() finds each terminator so the bytes
+    // between frames are copied in bulk instead of tested one at a time.
+    const uint8_t* p = data;
+    const uint8_t* const end = data + len;
+    while (p < end && conn->rxIndex < RX_BUFFER_SIZE - 1) {
+        // Message terminator is EOT only - phone apps must send EOT
+        const uint8_t* eot = static_cast<const uint8_t*>(memchr(p, EOT_CHAR, end - p));
+        appendRxBytes(conn, p, (eot ? eot : end) - p);
+        if (!eot || conn->rxIndex >= RX_BUFFER_SIZE - 1) {
+            break;
         }
 
-        // Check for message terminator (EOT only - phone apps must send EOT)
-        if (c == EOT_CHAR) {
-            // End of message - null terminate and deliver
-            conn->rxBuffer[conn->rxIndex] = '\0';
-
-            if (conn->rxIndex > 0 && _messageCallback) {
-                _messageCallback(conn->connHandle, conn->rxBuffer, conn->rxTimestamp);
-            }
-
-            // Reset buffer for next message
-            conn->rxIndex = 0;
-        } else {
-            // Add to buffer
-            conn->rxBuffer[conn->rxIndex++] = c;
+        // End of message - null terminate and deliver
+        conn->rxBuffer[conn->rxIndex] = '\0';
+        if (conn->rxIndex > 0 && _messageCallback) {
+            _messageCallback(conn->connHandle, conn->rxBuffer, conn->rxTimestamp);
         }
+
+        // Reset buffer for next message
+        conn->rxIndex = 0;
+        p = eot + 1;
     }
 
     // Handle buffer overflow
@@ -1057,10 +1095,11 @@ void BLEManager::_onPeriphConnect(uint16_t connHandleParam) {
     // Setup connection as UNKNOWN - wait for IDENTIFY message
     conn->connHandle = connHandleParam;
     conn->type = ConnectionType::UNKNOWN;
+    const uint32_t now = millis();
     conn->isConnected = true;
-    conn->connectedAt = millis();
+    conn->connectedAt = now;
     conn->pendingIdentify = true;
-    conn->identifyStartTime = millis();
+    conn->identifyStartTime = now;
     conn->rxIndex = 0;
 
     Serial.println(F("[BLE] Waiting for IDENTIFY message (1000ms timeout)..."));
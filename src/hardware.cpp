@@ -55,7 +55,7 @@ private:
 
 // LiPo discharge curve: {voltage, percentage}
 // 21 calibration points for accurate interpolation
-const float BatteryMonitor::VOLTAGE_CURVE[][2] = {
+const float BatteryMonitor::VOLTAGE_CURVE[VOLTAGE_CURVE_SIZE][2] = {
     {4.20f, 100}, {4.15f, 95}, {4.11f, 90}, {4.08f, 85}, {4.02f, 80},
     {3.98f, 75},  {3.95f, 70}, {3.91f, 65}, {3.87f, 60}, {3.85f, 55},
     {3.84f, 50},  {3.82f, 45}, {3.80f, 40}, {3.79f, 35}, {3.77f, 30},
@@ -63,8 +63,6 @@ const float BatteryMonitor::VOLTAGE_CURVE[][2] = {
     {3.27f, 0}
 };
 
-const uint8_t BatteryMonitor::VOLTAGE_CURVE_SIZE = sizeof(VOLTAGE_CURVE) / sizeof(VOLTAGE_CURVE[0]);
-
 // =============================================================================
 // HAPTIC CONTROLLER - Implementation
 // =============================================================================
@@ -150,13 +148,9 @@ bool HapticController::initializeFinger(uint8_t finger) {
         // longest PCB trace and needs extra settling time)
         delay(finger == 4 ? I2C_INIT_DELAY_CH4_MS : I2C_INIT_DELAY_MS);
 
-        // Configure for LRA + RTP mode
+        // Configure for LRA + RTP mode (also zeroes RTP - see configureDRV2605)
         configureDRV2605(_drv[finger]);
 
-        // SAFETY: Immediately stop motor after init - DRV2605 retains RTP value
-        // across MCU resets, so motor may be buzzing from pre-power-off state
-        _drv[finger].setRealtimeValue(0);
-
         closeChannels();
 
         // Mark as enabled
@@ -197,6 +191,9 @@ void HapticController::configureDRV2605(Adafruit_DRV2605& drv) {
     drv.setMode(DRV2605_MODE_REALTIME);
 
     // 6. Initialize RTP value to 0 (motor off)
+    // SAFETY: DRV2605 retains its RTP value across MCU resets, so the motor may
+    // be buzzing from the pre-power-off state. Callers rely on this write and
+    // do not repeat it.
     drv.setRealtimeValue(0);
 }
 
@@ -241,7 +238,6 @@ uint8_t HapticController::verifyAndHeal() {
         if (!selectChannel(f)) continue;
         if ((_drv[f].readRegister8(DRV_REG_FEEDBACK) & DRV_FB_N_ERM_LRA) == 0) {
             configureDRV2605(_drv[f]);
-            _drv[f].setRealtimeValue(0);
             healed++;
         }
         closeChannels();
@@ -404,7 +400,6 @@ void HapticController::diagSweep() {
             if (!_fingerEnabled[f]) continue;
             selectChannel(f);
             configureDRV2605(_drv[f]);
-            _drv[f].setRealtimeValue(0);
             closeChannels();
         }
     }
@@ -462,7 +457,6 @@ void HapticController::diagSweep() {
                 if (!_fingerEnabled[h]) continue;
                 selectChannel(h);
                 configureDRV2605(_drv[h]);
-                _drv[h].setRealtimeValue(0);
                 closeChannels();
             }
         }
@@ -556,7 +550,6 @@ uint8_t HapticController::probeMotorPresence() {
             I2CMutexLock lock(_i2cMutex);
             selectChannel(f);
             configureDRV2605(_drv[f]);
-            _drv[f].setRealtimeValue(0);
             closeChannels();
         }
 
@@ -89,7 +89,8 @@ bool autoStartTriggered = false; // Prevent repeated auto-starts (only accessed
 // Sync validity delayed start (PRIMARY only)
 // If sync not valid when auto-start triggers, retry after 1 second
 bool autoStartScheduled = false;   // Whether we're waiting to retry auto-start
-uint32_t autoStartTime = 0;        // When to retry auto-start (millis)
+uint32_t autoStartScheduledAt = 0; // When the retry was scheduled (millis)
+static constexpr uint32_t AUTO_START_RETRY_MS = 1000;
 uint8_t g_autoStartRetryCount = 0; // Auto-start sync retry counter (reset on SECONDARY disconnect)
 
 // Keepalive monitoring (bidirectional via PING/PONG)
@@ -103,9 +104,9 @@ volatile uint32_t g_lastMacrocycleReceivedMs = 0; // SECONDARY: last MACROCYCLE
 static constexpr uint32_t MACROCYCLE_ACTIVE_WINDOW_MS = 1000;
 
 // PRIMARY-side keepalive timeout
-// Aligned with SECONDARY's KEEPALIVE_TIMEOUT_MS (6000) to prevent race conditions
-// where PRIMARY shuts down before SECONDARY has timed out
-static constexpr uint32_t PRIMARY_KEEPALIVE_TIMEOUT_MS = 6000; // 6 seconds
+// Derived from SECONDARY's KEEPALIVE_TIMEOUT_MS so the two can never drift apart
+// (PRIMARY must not shut down before SECONDARY has timed out)
+static constexpr uint32_t PRIMARY_KEEPALIVE_TIMEOUT_MS = KEEPALIVE_TIMEOUT_MS;
 
 // PING/PONG latency measurement (PRIMARY only)
 // MUST be volatile: written in main loop, read in BLE callback
@@ -160,6 +161,24 @@ static inline void atomicWrite64(volatile uint64_t* ptr, uint64_t val) {
     PLATFORM_CRITICAL_EXIT();
 }
 
+// =============================================================================
+// SYNC COMMAND SEND HELPERS
+// =============================================================================
+// Serialize + send in one place so every call site shares the same buffer
+// sizing and failure handling. Returns false if serialization or send fails.
+
+static constexpr size_t SYNC_COMMAND_BUFFER_SIZE = 64;
+
+static bool sendSyncToSecondary(const SyncCommand& cmd) {
+    char buffer[SYNC_COMMAND_BUFFER_SIZE];
+    return cmd.serialize(buffer, sizeof(buffer)) && ble.sendToSecondary(buffer);
+}
+
+static bool sendSyncToPrimary(const SyncCommand& cmd) {
+    char buffer[SYNC_COMMAND_BUFFER_SIZE];
+    return cmd.serialize(buffer, sizeof(buffer)) && ble.sendToPrimary(buffer);
+}
+
 // =============================================================================
 // FREERTOS MOTOR TASK
 // =============================================================================
@@ -727,6 +746,7 @@ void loop()
             activationQueue.clear();  // Start fresh for macrocycle
         }
 
+        const bool debugMode = profiles.getDebugMode();  // Loop-invariant
         uint8_t eventsForwarded = 0;
         StagedMotorEvent staged;
         while (motorEventBuffer.unstage(staged)) {
@@ -737,7 +757,7 @@ void loop()
             // If this was the last event in a macrocycle, start scheduling
             if (staged.isMacrocycleLast) {
                 activationQueue.scheduleNext();
-                if (profiles.getDebugMode()) {
+                if (debugMode) {
                     Serial.printf("[MACROCYCLE] Forwarded %u events, scheduling started\n",
                                   eventsForwarded);
                 }
@@ -745,7 +765,7 @@ void loop()
         }
 
         // For single ACTIVATE events (not macrocycle), log if debug enabled
-        if (!isMacrocycleBatch && eventsForwarded > 0 && profiles.getDebugMode()) {
+        if (!isMacrocycleBatch && eventsForwarded > 0 && debugMode) {
             Serial.printf("[ACTIVATE] Forwarded %u event(s) from staging buffer\n",
                           eventsForwarded);
         }
@@ -988,11 +1008,9 @@ void loop()
             // This gives SECONDARY a chance to stop gracefully if BLE is still connected
             if (ble.isSecondaryConnected())
             {
-                char buffer[64];
                 SyncCommand cmd = SyncCommand::createStopSession(g_sequenceGenerator.next());
-                if (cmd.serialize(buffer, sizeof(buffer)))
+                if (sendSyncToSecondary(cmd))
                 {
-                    ble.sendToSecondary(buffer);
                     Serial.println(F("[SYNC] Sent STOP_SESSION due to timeout"));
                 }
             }
@@ -1033,7 +1051,8 @@ void loop()
     }
 
     // Check for scheduled auto-start retry (sync wasn't valid on first attempt)
-    if (autoStartScheduled && millis() >= autoStartTime)
+    // Elapsed-time compare stays correct across the 49-day millis() wrap
+    if (autoStartScheduled && millis() - autoStartScheduledAt >= AUTO_START_RETRY_MS)
     {
         autoStartScheduled = false;
         autoStartTherapy();
@@ -1979,12 +1998,7 @@ void onBLEMessage(uint16_t connHandle, const char *message, uint64_t rxTimestamp
                     Serial.printf("[ERROR] MACROCYCLE rejected: baseTime %ld seconds from now\n",
                                   (long)diffSec);  // Division reduces to 32-bit safe range
                     // Still send ACK to avoid retry storms
-                    SyncCommand ackCmd = SyncCommand::createMacrocycleAck(mc.sequenceId);
-                    char ackBuffer[32];
-                    if (ackCmd.serialize(ackBuffer, sizeof(ackBuffer)))
-                    {
-                        ble.sendToPrimary(ackBuffer);
-                    }
+                    sendSyncToPrimary(SyncCommand::createMacrocycleAck(mc.sequenceId));
                     return;
                 }
 
@@ -2030,12 +2044,7 @@ void onBLEMessage(uint16_t connHandle, const char *message, uint64_t rxTimestamp
                 // Serial.printf moved to main loop to avoid ISR context I/O
 
                 // Send ACK immediately
-                SyncCommand ackCmd = SyncCommand::createMacrocycleAck(mc.sequenceId);
-                char ackBuffer[32];
-                if (ackCmd.serialize(ackBuffer, sizeof(ackBuffer)))
-                {
-                    ble.sendToPrimary(ackBuffer);
-                }
+                sendSyncToPrimary(SyncCommand::createMacrocycleAck(mc.sequenceId));
             }
             else
             {
@@ -2424,7 +2433,10 @@ void onDeactivate(uint8_t finger)
     // Deactivate local motor
     if (haptic.isEnabled(finger))
     {
-        Serial.printf("[DEACTIVATE] Finger %d\n", finger);
+        if (profiles.getDebugMode())
+        {
+            Serial.printf("[DEACTIVATE] Finger %d\n", finger);
+        }
         haptic.deactivate(finger);
     }
 }
@@ -2496,8 +2508,6 @@ void onMacrocycleStart(uint32_t macrocycleCount)
     {
         if (deviceRole == DeviceRole::PRIMARY && ble.isSecondaryConnected())
         {
-            char buffer[64];
-
             if (syncProtocol.isClockSyncValid())
             {
                 // PTP SYNC MODE: Schedule flash at absolute time
@@ -2505,11 +2515,7 @@ void onMacrocycleStart(uint32_t macrocycleCount)
                 uint32_t leadTimeUs = syncProtocol.calculateAdaptiveLeadTime();
                 uint64_t flashTime = getMicros() + leadTimeUs;
 
-                SyncCommand cmd = SyncCommand::createDebugFlashWithTime(g_sequenceGenerator.next(), flashTime);
-                if (cmd.serialize(buffer, sizeof(buffer)))
-                {
-                    ble.sendToSecondary(buffer);
-                }
+                sendSyncToSecondary(SyncCommand::createDebugFlashWithTime(g_sequenceGenerator.next(), flashTime));
 
                 // NON-BLOCKING: Schedule local flash for later (checked in main loop)
                 // Critical: We must NOT block here - the MACROCYCLE is sent after this
@@ -2521,11 +2527,7 @@ void onMacrocycleStart(uint32_t macrocycleCount)
             else
             {
                 // LEGACY MODE: Use RTT/2 latency estimation
-                SyncCommand cmd = SyncCommand::createDebugFlash(g_sequenceGenerator.next());
-                if (cmd.serialize(buffer, sizeof(buffer)))
-                {
-                    ble.sendToSecondary(buffer);
-                }
+                sendSyncToSecondary(SyncCommand::createDebugFlash(g_sequenceGenerator.next()));
 
                 // NON-BLOCKING: Schedule local flash for later (checked in main loop)
                 uint32_t latencyUs = syncProtocol.getMeasuredLatency();
@@ -2619,12 +2621,7 @@ void startTherapyTest()
     // Notify SECONDARY of session start (enables pulsing LED on SECONDARY)
     if (deviceRole == DeviceRole::PRIMARY && ble.isSecondaryConnected())
     {
-        SyncCommand cmd = SyncCommand::createStartSession(g_sequenceGenerator.next());
-        char buffer[64];
-        if (cmd.serialize(buffer, sizeof(buffer)))
-        {
-            ble.sendToSecondary(buffer);
-        }
+        sendSyncToSecondary(SyncCommand::createStartSession(g_sequenceGenerator.next()));
     }
 
     // Reset latency metrics for fresh measurements
@@ -2722,7 +2719,7 @@ void autoStartTherapy()
             Serial.printf("[AUTO] Sync not valid (attempt %u/10) - retrying in 1 second\n", g_autoStartRetryCount);
             // Schedule retry in 1 second
             autoStartScheduled = true;
-            autoStartTime = millis() + 1000;
+            autoStartScheduledAt = millis();
             return;
         }
     }
@@ -2779,12 +2776,7 @@ void autoStartTherapy()
     // Notify SECONDARY of session start (enables pulsing LED on SECONDARY)
     if (ble.isSecondaryConnected())
     {
-        SyncCommand cmd = SyncCommand::createStartSession(g_sequenceGenerator.next());
-        char buffer[64];
-        if (cmd.serialize(buffer, sizeof(buffer)))
-        {
-            ble.sendToSecondary(buffer);
-        }
+        sendSyncToSecondary(SyncCommand::createStartSession(g_sequenceGenerator.next()));
     }
 
     // Reset latency metrics for fresh measurements
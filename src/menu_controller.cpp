@@ -101,13 +101,33 @@ void MenuController::setSendToSecondaryCallback(SendToSecondaryCallback callback
 // COMMAND PROCESSING
 // =============================================================================
 
+// Prefix lengths for INTERNAL_MESSAGES, computed at compile time so the
+// per-message classification does not strlen() every prefix.
+struct InternalMessageLengths {
+    uint8_t len[INTERNAL_MESSAGE_COUNT];
+};
+
+static constexpr InternalMessageLengths buildInternalMessageLengths() {
+    InternalMessageLengths lengths{};
+    for (size_t i = 0; i < INTERNAL_MESSAGE_COUNT; i++) {
+        size_t n = 0;
+        while (INTERNAL_MESSAGES[i][n] != '\0') {
+            n++;
+        }
+        lengths.len[i] = static_cast<uint8_t>(n);
+    }
+    return lengths;
+}
+
+static constexpr InternalMessageLengths INTERNAL_MESSAGE_LENGTHS = buildInternalMessageLengths();
+
 bool MenuController::isInternalMessage(const char* message) {
-    if (!message || strlen(message) == 0) {
+    if (!message || message[0] == '\0') {
         return false;
     }
 
     for (uint8_t i = 0; i < INTERNAL_MESSAGE_COUNT; i++) {
-        if (strncmp(message, INTERNAL_MESSAGES[i], strlen(INTERNAL_MESSAGES[i])) == 0) {
+        if (strncmp(message, INTERNAL_MESSAGES[i], INTERNAL_MESSAGE_LENGTHS.len[i]) == 0) {
             return true;
         }
     }
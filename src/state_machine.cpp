@@ -140,153 +140,141 @@ void TherapyStateMachine::notifyCallbacks(const StateTransition& transition) {
 }
 
 // =============================================================================
-// STATE TRANSITION LOGIC
+// TRANSITION TABLE
 // =============================================================================
 
-TherapyState TherapyStateMachine::determineNextState(TherapyState current, StateTrigger trigger) {
-    // TP-2: State passed in from caller to avoid TOCTOU race
-    // (caller already loaded it atomically)
-
-    switch (trigger) {
-        // =====================================================================
-        // CONNECTION TRIGGERS
-        // =====================================================================
-        case StateTrigger::CONNECTED:
-            if (current == TherapyState::IDLE || current == TherapyState::CONNECTING) {
-                return TherapyState::READY;
-            }
-            if (current == TherapyState::CONNECTION_LOST) {
-                return TherapyState::READY;
-            }
-            break;
-
-        case StateTrigger::DISCONNECTED:
-            // Any active state -> CONNECTION_LOST
-            if (current == TherapyState::RUNNING ||
-                current == TherapyState::PAUSED ||
-                current == TherapyState::READY) {
-                return TherapyState::CONNECTION_LOST;
-            }
-            break;
-
-        case StateTrigger::RECONNECTED:
-            if (current == TherapyState::CONNECTION_LOST) {
-                return TherapyState::READY;
-            }
-            break;
-
-        case StateTrigger::RECONNECT_FAILED:
-            if (current == TherapyState::CONNECTION_LOST) {
-                return TherapyState::IDLE;
-            }
-            break;
-
-        // =====================================================================
-        // SESSION TRIGGERS
-        // =====================================================================
-        case StateTrigger::START_SESSION:
-            if (current == TherapyState::READY || current == TherapyState::IDLE) {
-                return TherapyState::RUNNING;
-            }
-            break;
-
-        case StateTrigger::PAUSE_SESSION:
-            if (current == TherapyState::RUNNING) {
-                return TherapyState::PAUSED;
-            }
-            break;
-
-        case StateTrigger::RESUME_SESSION:
-            if (current == TherapyState::PAUSED) {
-                return TherapyState::RUNNING;
-            }
-            break;
-
-        case StateTrigger::STOP_SESSION:
-            if (current == TherapyState::RUNNING || current == TherapyState::PAUSED) {
-                return TherapyState::STOPPING;
-            }
-            break;
-
-        case StateTrigger::SESSION_COMPLETE:
-        case StateTrigger::STOPPED:
-            if (current == TherapyState::STOPPING) {
-                return TherapyState::IDLE;
-            }
-            if (current == TherapyState::RUNNING) {
-                return TherapyState::IDLE;
-            }
-            break;
-
-        // =====================================================================
-        // BATTERY TRIGGERS
-        // =====================================================================
-        case StateTrigger::BATTERY_WARNING:
-            if (current == TherapyState::RUNNING) {
-                return TherapyState::LOW_BATTERY;
-            }
-            break;
-
-        case StateTrigger::BATTERY_CRITICAL:
-            // Any state -> CRITICAL_BATTERY (emergency)
-            return TherapyState::CRITICAL_BATTERY;
-
-        case StateTrigger::BATTERY_OK:
-            if (current == TherapyState::LOW_BATTERY) {
-                return TherapyState::RUNNING;
-            }
-            break;
-
-        // =====================================================================
-        // PHONE TRIGGERS
-        // =====================================================================
-        case StateTrigger::PHONE_LOST:
-            if (current == TherapyState::READY || current == TherapyState::RUNNING) {
-                return TherapyState::PHONE_DISCONNECTED;
-            }
-            break;
-
-        case StateTrigger::PHONE_RECONNECTED:
-            if (current == TherapyState::PHONE_DISCONNECTED) {
-                // TP-2: Use atomic load for thread-safe read of previous state
-                return _previousState.load(std::memory_order_acquire);
-            }
-            break;
-
-        case StateTrigger::PHONE_TIMEOUT:
-            if (current == TherapyState::PHONE_DISCONNECTED) {
-                // Timeout waiting for phone - continue without
-                // TP-2: Use atomic load for thread-safe read of previous state
-                return _previousState.load(std::memory_order_acquire);
-            }
-            break;
-
-        // =====================================================================
-        // ERROR TRIGGERS
-        // =====================================================================
-        case StateTrigger::ERROR_OCCURRED:
-            return TherapyState::ERROR;
-
-        case StateTrigger::EMERGENCY_STOP:
-            // Emergency stop from any active state
-            if (isActiveState(current)) {
-                return TherapyState::ERROR;
+static constexpr size_t STATE_COUNT = static_cast<size_t>(TherapyState::PHONE_DISCONNECTED) + 1;
+static constexpr size_t TRIGGER_COUNT = static_cast<size_t>(StateTrigger::FORCED_SHUTDOWN) + 1;
+
+// Table cells hold the next state, or one of these markers
+static constexpr uint8_t NEXT_NONE = 0xFF;      // No valid transition - stay in current state
+static constexpr uint8_t NEXT_PREVIOUS = 0xFE;  // Return to _previousState
+
+struct TransitionRule {
+    StateTrigger trigger;
+    TherapyState from;
+    TherapyState to;
+};
+
+struct AnyStateRule {
+    StateTrigger trigger;
+    TherapyState to;
+};
+
+struct PreviousStateRule {
+    StateTrigger trigger;
+    TherapyState from;
+};
+
+static constexpr TransitionRule TRANSITION_RULES[] = {
+    // Connection triggers
+    { StateTrigger::CONNECTED,         TherapyState::IDLE,               TherapyState::READY },
+    { StateTrigger::CONNECTED,         TherapyState::CONNECTING,         TherapyState::READY },
+    { StateTrigger::CONNECTED,         TherapyState::CONNECTION_LOST,    TherapyState::READY },
+    { StateTrigger::DISCONNECTED,      TherapyState::RUNNING,            TherapyState::CONNECTION_LOST },
+    { StateTrigger::DISCONNECTED,      TherapyState::PAUSED,             TherapyState::CONNECTION_LOST },
+    { StateTrigger::DISCONNECTED,      TherapyState::READY,              TherapyState::CONNECTION_LOST },
+    { StateTrigger::RECONNECTED,       TherapyState::CONNECTION_LOST,    TherapyState::READY },
+    { StateTrigger::RECONNECT_FAILED,  TherapyState::CONNECTION_LOST,    TherapyState::IDLE },
+
+    // Session triggers
+    { StateTrigger::START_SESSION,     TherapyState::READY,              TherapyState::RUNNING },
+    { StateTrigger::START_SESSION,     TherapyState::IDLE,               TherapyState::RUNNING },
+    { StateTrigger::PAUSE_SESSION,     TherapyState::RUNNING,            TherapyState::PAUSED },
+    { StateTrigger::RESUME_SESSION,    TherapyState::PAUSED,             TherapyState::RUNNING },
+    { StateTrigger::STOP_SESSION,      TherapyState::RUNNING,            TherapyState::STOPPING },
+    { StateTrigger::STOP_SESSION,      TherapyState::PAUSED,             TherapyState::STOPPING },
+    { StateTrigger::SESSION_COMPLETE,  TherapyState::STOPPING,           TherapyState::IDLE },
+    { StateTrigger::SESSION_COMPLETE,  TherapyState::RUNNING,            TherapyState::IDLE },
+    { StateTrigger::STOPPED,           TherapyState::STOPPING,           TherapyState::IDLE },
+    { StateTrigger::STOPPED,           TherapyState::RUNNING,            TherapyState::IDLE },
+
+    // Battery triggers
+    { StateTrigger::BATTERY_WARNING,   TherapyState::RUNNING,            TherapyState::LOW_BATTERY },
+    { StateTrigger::BATTERY_OK,        TherapyState::LOW_BATTERY,        TherapyState::RUNNING },
+
+    // Phone triggers
+    { StateTrigger::PHONE_LOST,        TherapyState::READY,              TherapyState::PHONE_DISCONNECTED },
+    { StateTrigger::PHONE_LOST,        TherapyState::RUNNING,            TherapyState::PHONE_DISCONNECTED },
+};
+
+// Triggers that apply from every state
+static constexpr AnyStateRule ANY_STATE_RULES[] = {
+    { StateTrigger::BATTERY_CRITICAL,  TherapyState::CRITICAL_BATTERY },
+    { StateTrigger::ERROR_OCCURRED,    TherapyState::ERROR },
+    { StateTrigger::RESET,             TherapyState::IDLE },
+    { StateTrigger::FORCED_SHUTDOWN,   TherapyState::IDLE },
+};
+
+// Triggers that apply from every active state. Expanded via isActiveState() so
+// a new active state picks these up without editing the table.
+static constexpr AnyStateRule ACTIVE_STATE_RULES[] = {
+    { StateTrigger::EMERGENCY_STOP,    TherapyState::ERROR },
+};
+
+// Phone recovery returns to whatever state preceded PHONE_DISCONNECTED
+static constexpr PreviousStateRule PREVIOUS_STATE_RULES[] = {
+    { StateTrigger::PHONE_RECONNECTED, TherapyState::PHONE_DISCONNECTED },
+    { StateTrigger::PHONE_TIMEOUT,     TherapyState::PHONE_DISCONNECTED },
+};
+
+struct TransitionTable {
+    uint8_t next[TRIGGER_COUNT][STATE_COUNT];
+};
+
+static constexpr TransitionTable buildTransitionTable() {
+    TransitionTable table{};
+    for (size_t t = 0; t < TRIGGER_COUNT; t++) {
+        for (size_t s = 0; s < STATE_COUNT; s++) {
+            table.next[t][s] = NEXT_NONE;
+        }
+    }
+    for (const AnyStateRule& rule : ANY_STATE_RULES) {
+        for (size_t s = 0; s < STATE_COUNT; s++) {
+            table.next[static_cast<size_t>(rule.trigger)][s] = static_cast<uint8_t>(rule.to);
+        }
+    }
+    for (const AnyStateRule& rule : ACTIVE_STATE_RULES) {
+        for (size_t s = 0; s < STATE_COUNT; s++) {
+            if (isActiveState(static_cast<TherapyState>(s))) {
+                table.next[static_cast<size_t>(rule.trigger)][s] = static_cast<uint8_t>(rule.to);
             }
-            break;
+        }
+    }
+    for (const TransitionRule& rule : TRANSITION_RULES) {
+        table.next[static_cast<size_t>(rule.trigger)][static_cast<size_t>(rule.from)] =
+            static_cast<uint8_t>(rule.to);
+    }
+    for (const PreviousStateRule& rule : PREVIOUS_STATE_RULES) {
+        table.next[static_cast<size_t>(rule.trigger)][static_cast<size_t>(rule.from)] = NEXT_PREVIOUS;
+    }
+    return table;
+}
 
-        // =====================================================================
-        // RESET TRIGGERS
-        // =====================================================================
-        case StateTrigger::RESET:
-            return TherapyState::IDLE;
+// Built at compile time; lives in flash as TRIGGER_COUNT x STATE_COUNT bytes
+static constexpr TransitionTable TRANSITIONS = buildTransitionTable();
 
-        case StateTrigger::FORCED_SHUTDOWN:
-            return TherapyState::IDLE;
+// =============================================================================
+// STATE TRANSITION LOGIC
+// =============================================================================
 
-        default:
-            break;
+TherapyState TherapyStateMachine::determineNextState(TherapyState current, StateTrigger trigger) {
+    // TP-2: State passed in from caller to avoid TOCTOU race
+    // (caller already loaded it atomically)
+    size_t triggerIndex = static_cast<size_t>(trigger);
+    size_t stateIndex = static_cast<size_t>(current);
+    if (triggerIndex >= TRIGGER_COUNT || stateIndex >= STATE_COUNT) {
+        return current;
     }
 
-    // No valid transition - stay in current state
-    return current;
+    uint8_t next = TRANSITIONS.next[triggerIndex][stateIndex];
+    if (next == NEXT_NONE) {
+        // No valid transition - stay in current state
+        return current;
+    }
+    if (next == NEXT_PREVIOUS) {
+        // TP-2: Use atomic load for thread-safe read of previous state
+        return _previousState.load(std::memory_order_acquire);
+    }
+    return static_cast<TherapyState>(next);
 }
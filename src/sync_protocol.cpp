@@ -137,7 +137,7 @@ struct CommandTypeMapping {
     const char* str;
 };
 
-static const CommandTypeMapping COMMAND_MAPPINGS[] = {
+static constexpr CommandTypeMapping COMMAND_MAPPINGS[] = {
     { SyncCommandType::START_SESSION,  "START_SESSION" },
     { SyncCommandType::PAUSE_SESSION,  "PAUSE_SESSION" },
     { SyncCommandType::RESUME_SESSION, "RESUME_SESSION" },
@@ -151,7 +151,20 @@ static const CommandTypeMapping COMMAND_MAPPINGS[] = {
     { SyncCommandType::MACROCYCLE_ACK, "MC_ACK" }
 };
 
-static const size_t COMMAND_MAPPINGS_COUNT = sizeof(COMMAND_MAPPINGS) / sizeof(COMMAND_MAPPINGS[0]);
+static constexpr size_t COMMAND_MAPPINGS_COUNT = sizeof(COMMAND_MAPPINGS) / sizeof(COMMAND_MAPPINGS[0]);
+
+// getTypeString() indexes the table by enum value, so entries must stay in
+// SyncCommandType declaration order.
+static constexpr bool commandMappingsInEnumOrder() {
+    for (size_t i = 0; i < COMMAND_MAPPINGS_COUNT; i++) {
+        if (static_cast<size_t>(COMMAND_MAPPINGS[i].type) != i) {
+            return false;
+        }
+    }
+    return true;
+}
+static_assert(commandMappingsInEnumOrder(),
+              "COMMAND_MAPPINGS must list SyncCommandType values in declaration order");
 
 // =============================================================================
 // SYNC COMMAND - CONSTRUCTOR
@@ -237,11 +250,11 @@ void SyncCommand::serializeData(char* buffer, size_t bufferSize) const {
             buffer[pos++] = SYNC_DATA_DELIMITER;
         }
 
-        // Add value only
-        const char* value = _data[i].value;
-        while (*value && pos < bufferSize - 1) {
-            buffer[pos++] = *value++;
-        }
+        // Add value only - copy the whole run at once, truncating to fit
+        const size_t room = bufferSize - 1 - pos;
+        const size_t len = strnlen(_data[i].value, room);
+        memcpy(buffer + pos, _data[i].value, len);
+        pos += len;
     }
 
     buffer[pos] = '\0';
@@ -252,7 +265,15 @@ void SyncCommand::serializeData(char* buffer, size_t bufferSize) const {
 // =============================================================================
 
 bool SyncCommand::deserialize(const char* message) {
-    if (!message || strlen(message) < 3) {
+    if (!message) {
+        return false;
+    }
+
+    // Bounded length so only the message bytes are copied (strncpy would
+    // zero-fill the rest of the buffer on every received command)
+    char buffer[MESSAGE_BUFFER_SIZE];
+    size_t length = strnlen(message, sizeof(buffer) - 1);
+    if (length < 3) {
         return false;
     }
 
@@ -260,9 +281,8 @@ bool SyncCommand::deserialize(const char* message) {
     clearData();
 
     // Make a copy for parsing
-    char buffer[MESSAGE_BUFFER_SIZE];
-    strncpy(buffer, message, sizeof(buffer) - 1);
-    buffer[sizeof(buffer) - 1] = '\0';
+    memcpy(buffer, message, length);
+    buffer[length] = '\0';
 
     // New format: COMMAND:seq|timestamp|param|param|...
     // Find the colon that separates command type from parameters
@@ -333,14 +353,15 @@ bool SyncCommand::parseCommandType(const char* typeStr) {
 }
 
 bool SyncCommand::parseData(const char* dataStr) {
-    if (!dataStr || strlen(dataStr) == 0) {
+    if (!dataStr || *dataStr == '\0') {
         return true;  // No data is valid
     }
 
     // Make a copy for parsing
     char buffer[MESSAGE_BUFFER_SIZE];
-    strncpy(buffer, dataStr, sizeof(buffer) - 1);
-    buffer[sizeof(buffer) - 1] = '\0';
+    size_t length = strnlen(dataStr, sizeof(buffer) - 1);
+    memcpy(buffer, dataStr, length);
+    buffer[length] = '\0';
 
     // Parse pipe-delimited positional values
     char* token = strtok(buffer, "|");
@@ -362,10 +383,10 @@ bool SyncCommand::parseData(const char* dataStr) {
 // =============================================================================
 
 const char* SyncCommand::getTypeString() const {
-    for (size_t i = 0; i < COMMAND_MAPPINGS_COUNT; i++) {
-        if (COMMAND_MAPPINGS[i].type == _type) {
-            return COMMAND_MAPPINGS[i].str;
-        }
+    // Direct index - serialize() runs on every outgoing sync message
+    size_t index = static_cast<size_t>(_type);
+    if (index < COMMAND_MAPPINGS_COUNT) {
+        return COMMAND_MAPPINGS[index].str;
     }
     return "UNKNOWN";
 }
@@ -462,11 +483,14 @@ bool SyncCommand::hasData(const char* key) const {
 }
 
 void SyncCommand::clearData() {
-    _dataCount = 0;
-    for (uint8_t i = 0; i < SYNC_MAX_DATA_PAIRS; i++) {
+    // Only pairs below _dataCount are ever read, so wipe just those. A
+    // data-less command (PING, session control) makes this a no-op instead
+    // of a 384-byte memset on every deserialize().
+    for (uint8_t i = 0; i < _dataCount; i++) {
         memset(_data[i].key, 0, SYNC_MAX_KEY_LEN);
         memset(_data[i].value, 0, SYNC_MAX_VALUE_LEN);
     }
+    _dataCount = 0;
 }
 
 // =============================================================================
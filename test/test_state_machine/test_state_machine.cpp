@@ -328,30 +328,38 @@ void test_StateMachine_any_to_idle_on_forcedShutdown(void) {
 // INVALID TRANSITION TESTS
 // =============================================================================
 
-void test_StateMachine_invalid_transition_returns_false(void) {
-    TherapyStateMachine sm;
-    sm.begin(TherapyState::IDLE);
+struct InvalidTransitionCase {
+    TherapyState state;
+    StateTrigger trigger;
+};
 
-    // Can't pause when not running
-    TEST_ASSERT_FALSE(sm.transition(StateTrigger::PAUSE_SESSION));
-    TEST_ASSERT_EQUAL(TherapyState::IDLE, sm.getCurrentState());
-}
+static const InvalidTransitionCase INVALID_TRANSITIONS[] = {
+    { TherapyState::IDLE,    StateTrigger::PAUSE_SESSION },   // Can't pause when not running
+    { TherapyState::IDLE,    StateTrigger::RESUME_SESSION },
+    { TherapyState::IDLE,    StateTrigger::STOP_SESSION },
+    { TherapyState::READY,   StateTrigger::PAUSE_SESSION },
+    { TherapyState::RUNNING, StateTrigger::START_SESSION },
+    { TherapyState::RUNNING, StateTrigger::RESUME_SESSION },
+    { TherapyState::RUNNING, StateTrigger::CONNECTED },
+    { TherapyState::RUNNING, StateTrigger::BATTERY_OK },      // Battery OK only transitions from LOW_BATTERY
+};
 
-void test_StateMachine_resume_from_nonPaused_stays_same(void) {
-    TherapyStateMachine sm;
-    sm.begin(TherapyState::IDLE);
+void test_StateMachine_invalid_transitions_stay_same(void) {
+    char message[64];
 
-    TEST_ASSERT_FALSE(sm.transition(StateTrigger::RESUME_SESSION));
-    TEST_ASSERT_EQUAL(TherapyState::IDLE, sm.getCurrentState());
-}
+    for (const InvalidTransitionCase& tc : INVALID_TRANSITIONS) {
+        snprintf(message, sizeof(message), "%s + %s",
+                 therapyStateToString(tc.state), stateTriggerToString(tc.trigger));
 
-void test_StateMachine_batteryOk_from_running_stays_same(void) {
-    TherapyStateMachine sm;
-    sm.begin(TherapyState::RUNNING);
+        TherapyStateMachine sm;
+        sm.begin(tc.state);
+        sm.onStateChange(testCallback);
 
-    // Battery OK only transitions from LOW_BATTERY
-    TEST_ASSERT_FALSE(sm.transition(StateTrigger::BATTERY_OK));
-    TEST_ASSERT_EQUAL(TherapyState::RUNNING, sm.getCurrentState());
+        TEST_ASSERT_FALSE_MESSAGE(sm.transition(tc.trigger), message);
+        TEST_ASSERT_EQUAL_MESSAGE(tc.state, sm.getCurrentState(), message);
+    }
+
+    TEST_ASSERT_EQUAL(0, g_callbackCount);
 }
 
 // =============================================================================
@@ -708,9 +716,7 @@ int main(int argc, char **argv) {
     RUN_TEST(test_StateMachine_any_to_idle_on_forcedShutdown);
 
     // Invalid Transition Tests
-    RUN_TEST(test_StateMachine_invalid_transition_returns_false);
-    RUN_TEST(test_StateMachine_resume_from_nonPaused_stays_same);
-    RUN_TEST(test_StateMachine_batteryOk_from_running_stays_same);
+    RUN_TEST(test_StateMachine_invalid_transitions_stay_same);
 
     // Force State Tests
     RUN_TEST(test_StateMachine_forceState);
@@ -604,6 +604,11 @@ void test_SyncCommand_getTypeString_resume_session(void) {
     TEST_ASSERT_EQUAL_STRING("RESUME_SESSION", cmd.getTypeString());
 }
 
+void test_SyncCommand_getTypeString_out_of_range(void) {
+    SyncCommand cmd(static_cast<SyncCommandType>(0xFF), 0);
+    TEST_ASSERT_EQUAL_STRING("UNKNOWN", cmd.getTypeString());
+}
+
 // =============================================================================
 // TIMING UTILITY TESTS
 // =============================================================================
@@ -2314,6 +2319,7 @@ int main(int argc, char **argv) {
     RUN_TEST(test_SyncCommand_getTypeString_deactivate);
     RUN_TEST(test_SyncCommand_getTypeString_pause_session);
     RUN_TEST(test_SyncCommand_getTypeString_resume_session);
+    RUN_TEST(test_SyncCommand_getTypeString_out_of_range);
 
     // PTP Clock Synchronization Tests
     RUN_TEST(test_SimpleSyncProtocol_calculatePTPOffset_symmetric);